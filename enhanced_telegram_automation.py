@@ -42,7 +42,7 @@ import socket
 from fake_useragent import UserAgent
 import aiofiles
 import asyncpg
-from selenium_scraper import scrape_group_members_via_web
+from selenium_scraper import scrape_group_members_via_web, iter_members
 
 @dataclass
 class TelegramAccount:
@@ -376,18 +376,17 @@ class EnhancedTelegramAutomation:
         """Run Selenium scraper in a thread executor and store results."""
         loop = asyncio.get_event_loop()
         members = await loop.run_in_executor(None, scrape_group_members_via_web, group_link, max_members, profile_dir, headless, proxy_url)
-        # Convert to DB schema and store
-        batch = []
-        for m in members:
-            batch.append({
-                'id': m.get('id'),
-                'username': m.get('username'),
-                'first_name': m.get('first_name'),
-                'last_name': m.get('last_name'),
-                'phone': None,
-                'source_group': group_link,
-                'scraped_at': datetime.now().isoformat()
-            })
+        # Convert the scraper's rows to DB schema and store
+        scraped_at = datetime.now().isoformat()
+        batch = [{
+            'id': m.user_id,
+            'username': m.username,
+            'first_name': m.first_name,
+            'last_name': m.last_name,
+            'phone': None,
+            'source_group': group_link,
+            'scraped_at': scraped_at
+        } for m in iter_members(members)]
         if batch:
             await self.store_scraped_members(batch)
         return batch
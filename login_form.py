@@ -0,0 +1,81 @@
+#!/usr/bin/python3
+"""Dark-theme login form shared by simple_auth.py and test_auth.py"""
+
+import tkinter as tk
+import tkinter.font as tkfont
+
+BG = '#1a1a1a'
+BG_INPUT = '#333333'
+FG = '#ffffff'
+
+
+_root = None
+
+
+def get_root():
+    """Hidden Tk root shared by every login window in the process"""
+    global _root
+    try:
+        if _root is not None and _root.winfo_exists():
+            return _root
+    except tk.TclError:
+        pass
+    _root = tk.Tk()
+    _root.withdraw()
+    return _root
+
+
+def _widget_kwargs(widget):
+    """Widget option dicts for the form, compiled once per Tk interpreter (fonts are per root)"""
+    root = widget.nametowidget('.')
+    kwargs = getattr(root, '_login_form_kwargs', None)
+    if kwargs is None:
+        def font(size, weight='normal'):
+            return tkfont.Font(root, family='Arial', size=size, weight=weight)
+
+        kwargs = {
+            'title': dict(bg=BG, fg=FG, font=font(18, 'bold')),
+            'label': dict(bg=BG, fg='#cccccc', font=font(10)),
+            'entry': dict(font=font(12), bg=BG_INPUT, fg=FG, insertbackground=FG, relief='flat', bd=0),
+            'status': dict(bg=BG, fg='#888888', font=font(9)),
+            'button': dict(fg=FG, font=font(12, 'bold'), relief='flat', bd=0, cursor='hand2'),
+        }
+        root._login_form_kwargs = kwargs
+    return kwargs
+
+
+def build_login_form(parent, title, hint, on_submit, button_bg='#8B7355', username="admin"):
+    """Build the login form in parent; returns (username_entry, password_entry, status_label)"""
+    kw = _widget_kwargs(parent)
+
+    main_frame = tk.Frame(parent, bg=BG)
+    main_frame.pack(expand=True, fill=tk.BOTH, padx=40, pady=40)
+
+    # Title
+    tk.Label(main_frame, text=title, **kw['title']).pack(pady=(0, 30))
+
+    # Username field
+    tk.Label(main_frame, text="Username:", **kw['label']).pack(anchor=tk.W, pady=(0, 5))
+
+    username_entry = tk.Entry(main_frame, **kw['entry'])
+    username_entry.pack(fill=tk.X, pady=(0, 15), ipady=8)
+    username_entry.insert(0, username)
+
+    # Password field
+    tk.Label(main_frame, text="Password:", **kw['label']).pack(anchor=tk.W, pady=(0, 5))
+
+    password_entry = tk.Entry(main_frame, show='*', **kw['entry'])
+    password_entry.pack(fill=tk.X, pady=(0, 20), ipady=8)
+
+    # Status label
+    status_label = tk.Label(main_frame, text=hint, **kw['status'])
+    status_label.pack(pady=(0, 20))
+
+    # Login button
+    tk.Button(main_frame, text="🔐 LOGIN", command=on_submit, bg=button_bg,
+              **kw['button']).pack(fill=tk.X, pady=10, ipady=10)
+
+    # Enter anywhere in the window submits (entries propagate to their toplevel)
+    parent.winfo_toplevel().bind('<Return>', lambda event: on_submit())
+
+    return username_entry, password_entry, status_label
@@ -18,17 +18,61 @@ Version: 1.0.0
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import atexit
 import hashlib
+import hmac
 import json
 import os
+import pickle
+import shutil
 import subprocess
+import sys
+import tempfile
 import threading
 import time
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Dict, Iterable, List, Optional, Tuple
 import configparser
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 from premium_styling import apply_premium_styling, PremiumStyleManager
 
+if ORJSON_AVAILABLE:
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+    
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    def _json_loads(data: bytes):
+        return json.loads(data)
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+_TOR_START_ARGV = ('sudo', 'systemctl', 'start', 'tor')
+_TOR_STOP_ARGV = ('sudo', 'systemctl', 'stop', 'tor')
+
+_ROTATION_STRATEGIES = ('round_robin', 'random', 'least_used')
+_LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+
+_PROXYCHAINS_HEADER = """
+# Proxychains configuration generated by Premium Telegram Tool
+strict_chain
+proxy_dns
+remote_dns_subnet 224
+tcp_read_time_out 15000
+tcp_connect_time_out 8000
+localnet 127.0.0.0/255.0.0.0
+quiet_mode
+
+[ProxyList]
+"""
+
 class AuthenticationManager:
     """Secure authentication system for premium access"""
     
@@ -45,9 +89,10 @@ class AuthenticationManager:
             'admin': self._hash_password('password123!')
         }
     
-    def _hash_password(self, password: str) -> str:
-        """Hash password using SHA-256"""
-        return hashlib.sha256(password.encode()).hexdigest()
+    @staticmethod
+    def _hash_password(password: str) -> str:
+        """Hash password using BLAKE2b"""
+        return hashlib.blake2b(password.encode('utf-8'), digest_size=32).hexdigest()
     
     def authenticate(self, username: str, password: str) -> bool:
         """Authenticate user credentials"""
@@ -57,28 +102,28 @@ class AuthenticationManager:
         
         hashed_password = self._hash_password(password)
         
-        if username in self.valid_credentials and self.valid_credentials[username] == hashed_password:
+        expected = self.valid_credentials.get(username)
+        if expected is not None and hmac.compare_digest(expected, hashed_password):
             self.authenticated = True
             self.username = username
             self.login_attempts = 0
             return True
         else:
             self.login_attempts += 1
-            self.last_failed_attempt = datetime.now()
+            self.last_failed_attempt = time.monotonic()
             return False
     
     def is_locked_out(self) -> bool:
         """Check if account is locked out due to failed attempts"""
-        if self.login_attempts >= self.max_attempts and self.last_failed_attempt:
-            time_diff = (datetime.now() - self.last_failed_attempt).seconds
-            return time_diff < self.lockout_time
+        if self.login_attempts >= self.max_attempts and self.last_failed_attempt is not None:
+            return (time.monotonic() - self.last_failed_attempt) < self.lockout_time
         return False
     
     def get_lockout_remaining(self) -> int:
         """Get remaining lockout time in seconds"""
         if self.is_locked_out():
-            time_diff = (datetime.now() - self.last_failed_attempt).seconds
-            return max(0, self.lockout_time - time_diff)
+            elapsed = time.monotonic() - self.last_failed_attempt
+            return max(0, int(self.lockout_time - elapsed))
         return 0
 
 class ProxyChainManager:
@@ -87,6 +132,7 @@ class ProxyChainManager:
     def __init__(self):
         self.proxy_chains = []
         self.active_chain = None
+        self._last_applied_hash = None
         self.tor_enabled = False
         self.proxychains_config_path = "/etc/proxychains4.conf"
         self.custom_config_path = os.path.expanduser("~/.proxychains/proxychains.conf")
@@ -95,6 +141,8 @@ class ProxyChainManager:
         os.makedirs(os.path.dirname(self.custom_config_path), exist_ok=True)
         
         self.proxy_types = ['http', 'socks4', 'socks5']
+        self.test_cache_ttl = 60  # seconds a chain test result stays valid
+        self._test_cache: Dict[str, Tuple[bool, float]] = {}
         self.setup_default_chains()
     
     def setup_default_chains(self):
@@ -123,11 +171,36 @@ class ProxyChainManager:
                 'enabled': False
             }
         ]
+        self._chain_by_name = {c['name']: c for c in self.proxy_chains}
+    
+    def add_chain(self, chain: Dict):
+        """Add or replace a proxy chain, keeping the name index in sync"""
+        existing = self._chain_by_name.get(chain['name'])
+        if existing is not None:
+            self.proxy_chains[self.proxy_chains.index(existing)] = chain
+        else:
+            self.proxy_chains.append(chain)
+        self._chain_by_name[chain['name']] = chain
+        self._test_cache.pop(chain['name'], None)
+    
+    def remove_chain(self, chain_name: str) -> bool:
+        """Remove a proxy chain by name"""
+        chain = self._chain_by_name.pop(chain_name, None)
+        if chain is None:
+            return False
+        self.proxy_chains.remove(chain)
+        self._test_cache.pop(chain_name, None)
+        return True
+    
+    def get_chain(self, chain_name: str) -> Optional[Dict]:
+        """Look up a proxy chain by name"""
+        return self._chain_by_name.get(chain_name)
     
     def start_tor(self) -> bool:
         """Start Tor service"""
+        self._test_cache.clear()
         try:
-            result = subprocess.run(['sudo', 'systemctl', 'start', 'tor'], 
+            result = subprocess.run(_TOR_START_ARGV, 
                                   capture_output=True, text=True, timeout=30)
             if result.returncode == 0:
                 self.tor_enabled = True
@@ -140,8 +213,9 @@ class ProxyChainManager:
     
     def stop_tor(self) -> bool:
         """Stop Tor service"""
+        self._test_cache.clear()
         try:
-            result = subprocess.run(['sudo', 'systemctl', 'stop', 'tor'], 
+            result = subprocess.run(_TOR_STOP_ARGV, 
                                   capture_output=True, text=True, timeout=30)
             if result.returncode == 0:
                 self.tor_enabled = False
@@ -151,18 +225,40 @@ class ProxyChainManager:
             print(f"Error stopping Tor: {e}")
             return False
     
+    def get_cached_test_result(self, chain_name: str) -> Optional[bool]:
+        """Return a still-fresh chain test result, or None"""
+        cached = self._test_cache.get(chain_name)
+        if cached and time.monotonic() - cached[1] < self.test_cache_ttl:
+            return cached[0]
+        return None
+    
     def test_proxy_chain(self, chain_name: str) -> bool:
-        """Test if a proxy chain is working"""
-        chain = next((c for c in self.proxy_chains if c['name'] == chain_name), None)
+        """Test if a proxy chain is working (successes cached for test_cache_ttl)"""
+        result = self.get_cached_test_result(chain_name)
+        if result is None:
+            result = self._run_proxy_chain_test(chain_name)
+            # Failures are not cached so a retry (e.g. after starting Tor) really re-tests
+            if result:
+                self._test_cache[chain_name] = (result, time.monotonic())
+        return result
+    
+    def test_proxy_chain_async(self, chain_name: str, callback):
+        """Run test_proxy_chain in a background thread and pass the result to callback"""
+        threading.Thread(target=lambda: callback(self.test_proxy_chain(chain_name)),
+                         daemon=True).start()
+    
+    def _run_proxy_chain_test(self, chain_name: str) -> bool:
+        """Test a proxy chain with curl through proxychains (blocking)"""
+        chain = self._chain_by_name.get(chain_name)
         if not chain:
             return False
         
-        # Generate temporary proxychains config
+        # Generate temporary proxychains config (unique per test run)
         config_content = self.generate_proxychains_config(chain)
-        temp_config = "/tmp/test_proxychains.conf"
-        
-        with open(temp_config, 'w') as f:
+        with tempfile.NamedTemporaryFile('w', suffix='.conf', prefix='test_proxychains_',
+                                         delete=False) as f:
             f.write(config_content)
+            temp_config = f.name
         
         try:
             # Test with curl through proxychains
@@ -176,39 +272,37 @@ class ProxyChainManager:
             print(f"Proxy chain test failed: {e}")
             return False
         finally:
-            if os.path.exists(temp_config):
-                os.remove(temp_config)
+            try:
+                os.unlink(temp_config)
+            except FileNotFoundError:
+                pass
     
     def generate_proxychains_config(self, chain: Dict) -> str:
         """Generate proxychains configuration content"""
-        config = """
-# Proxychains configuration generated by Premium Telegram Tool
-strict_chain
-proxy_dns
-remote_dns_subnet 224
-tcp_read_time_out 15000
-tcp_connect_time_out 8000
-localnet 127.0.0.0/255.0.0.0
-quiet_mode
-
-[ProxyList]
-"""
-        for proxy in chain['proxies']:
-            config += f"{proxy['type']} {proxy['host']} {proxy['port']}\n"
-        
-        return config
+        proxies = tuple((p['type'], p['host'], p['port']) for p in chain['proxies'])
+        return self._render_proxychains_config(proxies)
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _render_proxychains_config(proxies: Tuple[Tuple[str, str, int], ...]) -> str:
+        """Render proxychains config for a hashable proxy list (memoized)"""
+        return _PROXYCHAINS_HEADER + "".join(f"{ptype} {host} {port}\n" for ptype, host, port in proxies)
     
     def apply_proxy_chain(self, chain_name: str) -> bool:
         """Apply a proxy chain as active configuration"""
-        chain = next((c for c in self.proxy_chains if c['name'] == chain_name), None)
+        chain = self._chain_by_name.get(chain_name)
         if not chain:
             return False
         
         config_content = self.generate_proxychains_config(chain)
+        content_hash = hashlib.blake2b(config_content.encode('utf-8'), digest_size=8).digest()
         
         try:
-            with open(self.custom_config_path, 'w') as f:
-                f.write(config_content)
+            # Skip the write when this exact config was already applied
+            if content_hash != self._last_applied_hash or not os.path.exists(self.custom_config_path):
+                with open(self.custom_config_path, 'w') as f:
+                    f.write(config_content)
+                self._last_applied_hash = content_hash
             
             self.active_chain = chain_name
             return True
@@ -225,15 +319,30 @@ quiet_mode
             'enabled_chains': len([c for c in self.proxy_chains if c['enabled']])
         }
 
+def _freeze(value):
+    """Recursively convert settings dicts into attribute-access namespaces"""
+    if isinstance(value, dict):
+        return SimpleNamespace(**{k: _freeze(v) for k, v in value.items()})
+    return value
+
 class AdvancedSettingsManager:
     """Comprehensive settings management system"""
     
     def __init__(self):
         self.settings_file = "premium_settings.json"
+        self._dirty = False  # set() only marks changes; flush() persists them
+        self._get_cached = lru_cache(maxsize=None)(self._lookup)
+        self._save_lock = threading.Lock()
         self.load_settings()
+        atexit.register(self.flush)
     
     def get_default_settings(self) -> Dict:
-        """Get default settings configuration"""
+        """Get a fresh deep copy of the default settings configuration"""
+        return pickle.loads(_DEFAULTS_BLOB)
+    
+    @staticmethod
+    def _build_defaults() -> Dict:
+        """Build the default settings configuration"""
         return {
             # Proxy Settings
             'proxy': {
@@ -332,27 +441,51 @@ class AdvancedSettingsManager:
         """Load settings from file or create defaults"""
         try:
             if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r') as f:
-                    self.settings = json.load(f)
+                with open(self.settings_file, 'rb') as f:
+                    self.settings = _intern_keys(_json_loads(f.read()))
             else:
                 self.settings = self.get_default_settings()
                 self.save_settings()
         except Exception as e:
             print(f"Error loading settings: {e}")
             self.settings = self.get_default_settings()
+        self._ns = _freeze(self.settings)
+        self._get_cached.cache_clear()
+        self._dirty = False
     
     def save_settings(self):
-        """Save current settings to file"""
+        """Save current settings to file atomically (temp file + replace)"""
+        tmp_file = self.settings_file + '.tmp'
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=4)
+            with self._save_lock:
+                data = _json_dumps(self.settings)
+                with open(tmp_file, 'wb') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                if os.path.exists(self.settings_file):
+                    shutil.copyfile(self.settings_file, self.settings_file + '.bak')
+                os.replace(tmp_file, self.settings_file)
+                self._dirty = False
         except Exception as e:
             print(f"Error saving settings: {e}")
     
+    def flush(self):
+        """Persist pending changes made through set(), if any"""
+        if self._dirty:
+            self.save_settings()
+    
     def get(self, category: str, key: str = None):
-        """Get setting value"""
+        """Get setting value (memoized until the next set/reset/load)
+
+        A whole category comes back as a copy; change settings through set()/update().
+        """
         if key is None:
-            return self.settings.get(category, {})
+            return dict(self.settings.get(category, {}))
+        return self._get_cached(category, key)
+    
+    def _lookup(self, category: str, key: str):
+        """Uncached leaf lookup backing get()"""
         return self.settings.get(category, {}).get(key)
     
     def set(self, category: str, key: str, value):
@@ -360,6 +493,16 @@ class AdvancedSettingsManager:
         if category not in self.settings:
             self.settings[category] = {}
         self.settings[category][key] = value
+        setattr(self._ns, category, _freeze(self.settings[category]))
+        self._get_cached.cache_clear()
+        self._dirty = True
+    
+    def update(self, payload: Dict[str, Dict]):
+        """Merge nested {category: {key: value}} settings and save them with a single write"""
+        for category, values in payload.items():
+            self.settings.setdefault(category, {}).update(values)
+            setattr(self._ns, category, _freeze(self.settings[category]))
+        self._get_cached.cache_clear()
         self.save_settings()
     
     def reset_category(self, category: str):
@@ -367,7 +510,44 @@ class AdvancedSettingsManager:
         defaults = self.get_default_settings()
         if category in defaults:
             self.settings[category] = defaults[category]
+            setattr(self._ns, category, _freeze(defaults[category]))
+            self._get_cached.cache_clear()
             self.save_settings()
+    
+    def reset_all_to_defaults(self, categories: Optional[Iterable[str]] = None):
+        """Reset the given categories (default: all) to defaults with a single write"""
+        defaults = self.get_default_settings()
+        for category in defaults if categories is None else categories:
+            if category in defaults:
+                self.settings[category] = defaults[category]
+        self._ns = _freeze(self.settings)
+        self._get_cached.cache_clear()
+        self.save_settings()
+    
+    def __getattr__(self, name: str):
+        """Dotted read access to categories, e.g. settings.proxy.active_chain"""
+        ns = self.__dict__.get('_ns')
+        if ns is not None and name in ns.__dict__:
+            return ns.__dict__[name]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+# Defaults are pure data; a pickle round-trip is a cheap deep copy
+_DEFAULTS_BLOB = pickle.dumps(AdvancedSettingsManager._build_defaults())
+
+# Category and key names, interned so lookups on loaded settings hit the
+# identity fast path in dict lookups
+_KNOWN_KEYS = frozenset(
+    sys.intern(k)
+    for category, values in AdvancedSettingsManager._build_defaults().items()
+    for k in (category, *values)
+)
+
+def _intern_keys(value):
+    """Recursively replace known settings keys with their interned copies"""
+    if isinstance(value, dict):
+        return {(sys.intern(k) if k in _KNOWN_KEYS else k): _intern_keys(v)
+                for k, v in value.items()}
+    return value
 
 class LoginWindow:
     """Premium login window with authentication"""
@@ -525,9 +705,78 @@ class LoginWindow:
         self.root.mainloop()
         return self.auth_manager.authenticated
 
+class VirtualScrollFrame(tk.Frame):
+    """Scrollable column of fixed-height rows; only rows in the viewport are mapped"""
+    
+    def __init__(self, parent, bg: str, **kwargs):
+        super().__init__(parent, bg=bg, **kwargs)
+        self.canvas = tk.Canvas(self, bg=bg, highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+        self.canvas.bind('<Configure>', lambda e: self._refresh())
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+        # [builder(parent) -> widget, y offset, height, canvas item id or None]
+        self._rows = []
+        self._total_height = 0
+    
+    def add(self, builder, height: int):
+        """Append a row; builder(parent) is called the first time the row is visible"""
+        self._rows.append([builder, self._total_height, height, None])
+        self._total_height += height
+        self.canvas.configure(scrollregion=(0, 0, 0, self._total_height))
+    
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._refresh()
+    
+    def _refresh(self):
+        """Build rows entering the viewport and hide the ones outside it"""
+        canvas = self.canvas
+        top = canvas.canvasy(0)
+        bottom = top + canvas.winfo_height()
+        width = canvas.winfo_width()
+        for row in self._rows:
+            builder, y, height, item = row
+            visible = y < bottom and y + height > top
+            if item is None:
+                if visible:
+                    row[3] = canvas.create_window(0, y, window=builder(canvas), anchor="nw",
+                                                  width=width, height=height)
+            else:
+                canvas.itemconfigure(item, state="normal" if visible else "hidden", width=width)
+
+
 class SettingsWindow:
     """Comprehensive settings management interface"""
     
+    # Tk class of the settings Toplevel; scopes its option-database defaults
+    _WINDOW_CLASS = 'PremiumSettings'
+    
+    # (category, setting key, Tk variable attribute) saved on Save and reloaded by show()
+    _SETTING_VARS = (
+        ('proxy', 'active_chain', 'chain_var'),
+        ('anti_detection', 'enabled', 'anti_detection_var'),
+        ('anti_detection', 'user_agent_rotation', 'ua_rotation_var'),
+        ('anti_detection', 'random_delays', 'random_delays_var'),
+        ('anti_detection', 'delay_min', 'delay_min_var'),
+        ('anti_detection', 'delay_max', 'delay_max_var'),
+        ('anti_detection', 'session_rotation', 'anti_session_rotation_var'),
+        ('anti_detection', 'stealth_mode', 'stealth_mode_var'),
+        ('anti_detection', 'simulate_human_behavior', 'human_behavior_var'),
+        ('health_check', 'enabled', 'health_enabled_var'),
+        ('health_check', 'interval', 'health_interval_var'),
+        ('health_check', 'auto_recover', 'auto_recover_var'),
+        ('session_management', 'auto_rotate', 'mgmt_session_rotation_var'),
+        ('session_management', 'rotation_strategy', 'rotation_strategy_var'),
+        ('session_management', 'max_concurrent_sessions', 'max_sessions_var'),
+        ('debugging', 'enabled', 'debug_enabled_var'),
+        ('debugging', 'log_level', 'log_level_var'),
+        ('debugging', 'verbose_errors', 'verbose_errors_var'),
+        ('performance', 'max_threads', 'max_threads_var'),
+        ('performance', 'batch_size', 'batch_size_var'),
+    )
+    
     def __init__(self, parent, settings_manager: AdvancedSettingsManager, 
                  proxy_manager: ProxyChainManager):
         self.parent = parent
@@ -537,49 +786,90 @@ class SettingsWindow:
         self.style_manager = PremiumStyleManager()
     
     def show(self):
-        """Show the settings window"""
+        """Show the settings window, reusing the hidden one if it was built"""
         if self.window and self.window.winfo_exists():
+            if self.window.state() == 'withdrawn':
+                self._reload_setting_vars()
+                self.window.deiconify()
             self.window.lift()
             return
         
-        self.window = tk.Toplevel(self.parent)
+        self.window = tk.Toplevel(self.parent, class_=self._WINDOW_CLASS)
+        self._apply_option_db()
         self.window.title("⚙️ Premium Settings")
         self.window.geometry("1000x600")  # Wider but shorter
         self.window.configure(bg=self.style_manager.colors['bg_dark'])
         
         # Apply premium styling
         self.style_manager.apply_premium_theme(self.window, 'telegram')
+        self.window.protocol("WM_DELETE_WINDOW", self.hide)
         
         self.setup_settings_interface()
     
+    def _apply_option_db(self):
+        """Register card-row widget defaults and styles once instead of per widget"""
+        colors = self.style_manager.colors
+        body_font = self.style_manager.fonts['body']
+        scope = f'*{self._WINDOW_CLASS}*'
+        for pattern, value in (('Label.background', colors['bg_card']),
+                               ('Label.foreground', colors['text_primary']),
+                               ('Label.font', body_font)):
+            self.window.option_add(scope + pattern, value)
+        style = ttk.Style(self.window)
+        style.configure('Card.TCheckbutton', background=colors['bg_card'],
+                        foreground=colors['text_primary'], font=body_font)
+        style.configure('Card.TSpinbox', fieldbackground=colors['bg_input'],
+                        foreground=colors['text_primary'])
+    
+    def hide(self):
+        """Hide the window; unsaved edits stay in its variables until show() reloads them"""
+        self.window.withdraw()
+    
+    def _reload_setting_vars(self):
+        """Discard unsaved edits by reloading built tabs' variables from settings"""
+        for category, key, attr in self._SETTING_VARS:
+            var = getattr(self, attr, None)
+            if var is not None:
+                var.set(self.settings.get(category, key))
+    
     def setup_settings_interface(self):
         """Setup the settings interface"""
+        colors = self.style_manager.colors
+        fonts = self.style_manager.fonts
         # Main container
-        main_frame = tk.Frame(self.window, bg=self.style_manager.colors['bg_dark'])
+        main_frame = tk.Frame(self.window, bg=colors['bg_dark'])
         main_frame.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
         
         # Title
         title_label = tk.Label(main_frame,
                               text="⚙️ Premium Settings Configuration",
-                              bg=self.style_manager.colors['bg_dark'],
-                              fg=self.style_manager.colors['text_primary'],
-                              font=self.style_manager.fonts['heading'])
+                              bg=colors['bg_dark'],
+                              fg=colors['text_primary'],
+                              font=fonts['heading'])
         title_label.pack(pady=(0, 20))
         
         # Create notebook for settings categories
         notebook = ttk.Notebook(main_frame, style='Premium.TNotebook')
         notebook.pack(expand=True, fill=tk.BOTH)
         
-        # Settings tabs
-        self.create_proxy_tab(notebook)
-        self.create_anti_detection_tab(notebook)
-        self.create_health_check_tab(notebook)
-        self.create_session_management_tab(notebook)
-        self.create_debugging_tab(notebook)
-        self.create_performance_tab(notebook)
+        # Settings tabs: placeholders now, contents built on first view
+        for _, _, attr in self._SETTING_VARS:
+            self.__dict__.pop(attr, None)
+        self._pending_tabs = {}
+        for title, builder in (("🌐 Proxy & Chains", self.create_proxy_tab),
+                               ("🛡️ Anti-Detection", self.create_anti_detection_tab),
+                               ("💊 Health Checks", self.create_health_check_tab),
+                               ("🔄 Session Rotation", self.create_session_management_tab),
+                               ("🐛 Debugging", self.create_debugging_tab),
+                               ("⚡ Performance", self.create_performance_tab)):
+            frame = ttk.Frame(notebook, style='Premium.TFrame')
+            notebook.add(frame, text=title)
+            self._pending_tabs[str(frame)] = (builder, frame)
+        notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        self._build_tab(notebook.select())
         
         # Bottom buttons
-        button_frame = tk.Frame(main_frame, bg=self.style_manager.colors['bg_dark'])
+        button_frame = tk.Frame(main_frame, bg=colors['bg_dark'])
         button_frame.pack(fill=tk.X, pady=(20, 0))
         
         self.style_manager.create_premium_button(
@@ -591,18 +881,28 @@ class SettingsWindow:
         ).pack(side=tk.RIGHT)
         
         self.style_manager.create_premium_button(
-            button_frame, "❌ Cancel", self.window.destroy
+            button_frame, "❌ Cancel", self.hide
         ).pack(side=tk.RIGHT, padx=(0, 10))
     
-    def create_proxy_tab(self, notebook):
+    def _on_tab_changed(self, event):
+        """Build a settings tab the first time it is selected"""
+        self._build_tab(event.widget.select())
+    
+    def _build_tab(self, tab_id: str):
+        """Run the pending builder for a notebook tab, if any"""
+        pending = self._pending_tabs.pop(str(tab_id), None)
+        if pending:
+            builder, frame = pending
+            builder(frame)
+    
+    def create_proxy_tab(self, frame):
         """Create proxy settings tab"""
-        frame = ttk.Frame(notebook, style='Premium.TFrame')
-        notebook.add(frame, text="🌐 Proxy & Chains")
+        colors = self.style_manager.colors
         
         # Scrollable frame
-        canvas = tk.Canvas(frame, bg=self.style_manager.colors['bg_dark'])
+        canvas = tk.Canvas(frame, bg=colors['bg_dark'])
         scrollbar = ttk.Scrollbar(frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg=self.style_manager.colors['bg_dark'])
+        scrollable_frame = tk.Frame(canvas, bg=colors['bg_dark'])
         
         canvas.configure(yscrollcommand=scrollbar.set)
         canvas.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
@@ -615,14 +915,10 @@ class SettingsWindow:
         chain_card.pack(fill=tk.X, pady=10)
         
         # Tor control
-        tor_frame = tk.Frame(chain_content, bg=self.style_manager.colors['bg_card'])
+        tor_frame = tk.Frame(chain_content, bg=colors['bg_card'])
         tor_frame.pack(fill=tk.X, pady=5)
         
-        tk.Label(tor_frame,
-                text="🧅 Tor Service:",
-                bg=self.style_manager.colors['bg_card'],
-                fg=self.style_manager.colors['text_primary'],
-                font=self.style_manager.fonts['body']).pack(side=tk.LEFT)
+        tk.Label(tor_frame, text="🧅 Tor Service:").pack(side=tk.LEFT)
         
         self.style_manager.create_premium_button(
             tor_frame, "▶️ Start Tor", lambda: self.proxy_manager.start_tor(), 'Success'
@@ -633,14 +929,10 @@ class SettingsWindow:
         ).pack(side=tk.RIGHT, padx=(5, 0))
         
         # Chain selection
-        chain_select_frame = tk.Frame(chain_content, bg=self.style_manager.colors['bg_card'])
+        chain_select_frame = tk.Frame(chain_content, bg=colors['bg_card'])
         chain_select_frame.pack(fill=tk.X, pady=10)
         
-        tk.Label(chain_select_frame,
-                text="Active Chain:",
-                bg=self.style_manager.colors['bg_card'],
-                fg=self.style_manager.colors['text_primary'],
-                font=self.style_manager.fonts['body']).pack(side=tk.LEFT)
+        tk.Label(chain_select_frame, text="Active Chain:").pack(side=tk.LEFT)
         
         self.chain_var = tk.StringVar(value=self.settings.get('proxy', 'active_chain'))
         chain_combo = ttk.Combobox(chain_select_frame,
@@ -662,133 +954,67 @@ class SettingsWindow:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
     
-    def create_anti_detection_tab(self, notebook):
+    def create_anti_detection_tab(self, frame):
         """Create anti-detection settings tab"""
-        frame = ttk.Frame(notebook, style='Premium.TFrame')
-        notebook.add(frame, text="🛡️ Anti-Detection")
+        colors = self.style_manager.colors
         
-        main_content = tk.Frame(frame, bg=self.style_manager.colors['bg_dark'])
+        main_content = tk.Frame(frame, bg=colors['bg_dark'])
         main_content.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
         
-        # Create scrollable frame for anti-detection settings
-        canvas = tk.Canvas(main_content, bg=self.style_manager.colors['bg_dark'])
-        scrollbar = ttk.Scrollbar(main_content, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg=self.style_manager.colors['bg_dark'])
-        
-        canvas.configure(yscrollcommand=scrollbar.set)
-        canvas.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        
         # Anti-Detection Settings
         detection_card, detection_content = self.style_manager.create_premium_card(
-            scrollable_frame, "🛡️ Anti-Detection Configuration", 800, 350
+            main_content, "🛡️ Anti-Detection Configuration", 800, 350
         )
-        detection_card.pack(fill=tk.X, pady=10)
-        
-        # Enable/Disable anti-detection
-        self.anti_detection_var = tk.BooleanVar(value=self.settings.get('anti_detection', 'enabled'))
-        tk.Checkbutton(detection_content,
-                      text="Enable Anti-Detection System",
-                      variable=self.anti_detection_var,
-                      bg=self.style_manager.colors['bg_card'],
-                      fg=self.style_manager.colors['text_primary'],
-                      selectcolor=self.style_manager.colors['bg_input'],
-                      font=self.style_manager.fonts['body']).pack(anchor=tk.W, pady=5)
-        
-        # User Agent Rotation
-        self.ua_rotation_var = tk.BooleanVar(value=self.settings.get('anti_detection', 'user_agent_rotation'))
-        tk.Checkbutton(detection_content,
-                      text="Rotate User Agents",
-                      variable=self.ua_rotation_var,
-                      bg=self.style_manager.colors['bg_card'],
-                      fg=self.style_manager.colors['text_primary'],
-                      selectcolor=self.style_manager.colors['bg_input'],
-                      font=self.style_manager.fonts['body']).pack(anchor=tk.W, pady=5)
-        
-        # Random Delays
-        self.random_delays_var = tk.BooleanVar(value=self.settings.get('anti_detection', 'random_delays'))
-        tk.Checkbutton(detection_content,
-                      text="Random Request Delays",
-                      variable=self.random_delays_var,
-                      bg=self.style_manager.colors['bg_card'],
-                      fg=self.style_manager.colors['text_primary'],
-                      selectcolor=self.style_manager.colors['bg_input'],
-                      font=self.style_manager.fonts['body']).pack(anchor=tk.W, pady=5)
-        
-        # Delay configuration
-        delay_frame = tk.Frame(detection_content, bg=self.style_manager.colors['bg_card'])
-        delay_frame.pack(fill=tk.X, pady=10)
-        
-        tk.Label(delay_frame,
-                text="Delay Range (seconds):",
-                bg=self.style_manager.colors['bg_card'],
-                fg=self.style_manager.colors['text_primary'],
-                font=self.style_manager.fonts['body']).pack(side=tk.LEFT)
-        
-        self.delay_min_var = tk.DoubleVar(value=self.settings.get('anti_detection', 'delay_min'))
-        delay_min_spin = tk.Spinbox(delay_frame,
-                                   from_=0.1, to=10.0, increment=0.1,
-                                   textvariable=self.delay_min_var,
-                                   width=8,
-                                   bg=self.style_manager.colors['bg_input'],
-                                   fg=self.style_manager.colors['text_primary'])
+        detection_card.pack(expand=True, fill=tk.BOTH, pady=10)
+        
+        # Rows are only built once scrolled into view
+        rows = VirtualScrollFrame(detection_content, colors['bg_card'])
+        rows.pack(expand=True, fill=tk.BOTH)
+        
+        self._add_virtual_checkbuttons(rows, 'anti_detection', (
+            ('anti_detection_var', 'enabled', "Enable Anti-Detection System"),
+            ('ua_rotation_var', 'user_agent_rotation', "Rotate User Agents"),
+            ('random_delays_var', 'random_delays', "Random Request Delays"),
+        ))
+        
+        self._setting_var('delay_min_var', 'anti_detection', 'delay_min', tk.DoubleVar)
+        self._setting_var('delay_max_var', 'anti_detection', 'delay_max', tk.DoubleVar)
+        rows.add(self._build_delay_row, 50)
+        
+        self._add_virtual_checkbuttons(rows, 'anti_detection', (
+            ('anti_session_rotation_var', 'session_rotation', "Enable Session Rotation"),
+            ('stealth_mode_var', 'stealth_mode', "Enable Stealth Mode"),
+            ('human_behavior_var', 'simulate_human_behavior', "Simulate Human Behavior"),
+        ))
+    
+    def _build_delay_row(self, parent):
+        """Build the min/max request delay row"""
+        delay_frame = tk.Frame(parent, bg=self.style_manager.colors['bg_card'])
+        
+        tk.Label(delay_frame, text="Delay Range (seconds):").pack(side=tk.LEFT)
+        
+        delay_min_spin = ttk.Spinbox(delay_frame,
+                                    from_=0.1, to=10.0, increment=0.1,
+                                    textvariable=self.delay_min_var,
+                                    width=8,
+                                    style='Card.TSpinbox')
         delay_min_spin.pack(side=tk.LEFT, padx=(10, 5))
         
-        tk.Label(delay_frame,
-                text="to",
-                bg=self.style_manager.colors['bg_card'],
-                fg=self.style_manager.colors['text_primary'],
-                font=self.style_manager.fonts['body']).pack(side=tk.LEFT)
-        
-        self.delay_max_var = tk.DoubleVar(value=self.settings.get('anti_detection', 'delay_max'))
-        delay_max_spin = tk.Spinbox(delay_frame,
-                                   from_=0.1, to=10.0, increment=0.1,
-                                   textvariable=self.delay_max_var,
-                                   width=8,
-                                   bg=self.style_manager.colors['bg_input'],
-                                   fg=self.style_manager.colors['text_primary'])
-        delay_max_spin.pack(side=tk.LEFT, padx=(5, 0))
+        tk.Label(delay_frame, text="to").pack(side=tk.LEFT)
         
-        # Session rotation settings
-        self.session_rotation_var = tk.BooleanVar(value=self.settings.get('anti_detection', 'session_rotation'))
-        tk.Checkbutton(detection_content,
-                      text="Enable Session Rotation",
-                      variable=self.session_rotation_var,
-                      bg=self.style_manager.colors['bg_card'],
-                      fg=self.style_manager.colors['text_primary'],
-                      selectcolor=self.style_manager.colors['bg_input'],
-                      font=self.style_manager.fonts['body']).pack(anchor=tk.W, pady=5)
-        
-        # Stealth mode
-        self.stealth_mode_var = tk.BooleanVar(value=self.settings.get('anti_detection', 'stealth_mode'))
-        tk.Checkbutton(detection_content,
-                      text="Enable Stealth Mode",
-                      variable=self.stealth_mode_var,
-                      bg=self.style_manager.colors['bg_card'],
-                      fg=self.style_manager.colors['text_primary'],
-                      selectcolor=self.style_manager.colors['bg_input'],
-                      font=self.style_manager.fonts['body']).pack(anchor=tk.W, pady=5)
-        
-        # Human behavior simulation
-        self.human_behavior_var = tk.BooleanVar(value=self.settings.get('anti_detection', 'simulate_human_behavior'))
-        tk.Checkbutton(detection_content,
-                      text="Simulate Human Behavior",
-                      variable=self.human_behavior_var,
-                      bg=self.style_manager.colors['bg_card'],
-                      fg=self.style_manager.colors['text_primary'],
-                      selectcolor=self.style_manager.colors['bg_input'],
-                      font=self.style_manager.fonts['body']).pack(anchor=tk.W, pady=5)
-        
-        # Pack canvas and scrollbar
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        delay_max_spin = ttk.Spinbox(delay_frame,
+                                    from_=0.1, to=10.0, increment=0.1,
+                                    textvariable=self.delay_max_var,
+                                    width=8,
+                                    style='Card.TSpinbox')
+        delay_max_spin.pack(side=tk.LEFT, padx=(5, 0))
+        return delay_frame
     
-    def create_health_check_tab(self, notebook):
+    def create_health_check_tab(self, frame):
         """Create health check settings tab"""
-        frame = ttk.Frame(notebook, style='Premium.TFrame')
-        notebook.add(frame, text="💊 Health Checks")
+        colors = self.style_manager.colors
         
-        main_content = tk.Frame(frame, bg=self.style_manager.colors['bg_dark'])
+        main_content = tk.Frame(frame, bg=colors['bg_dark'])
         main_content.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
         
         # Health Check Settings
@@ -797,51 +1023,23 @@ class SettingsWindow:
         )
         health_card.pack(fill=tk.X, pady=10)
         
-        # Enable health checks
-        self.health_enabled_var = tk.BooleanVar(value=self.settings.get('health_check', 'enabled'))
-        tk.Checkbutton(health_content,
-                      text="Enable Health Monitoring",
-                      variable=self.health_enabled_var,
-                      bg=self.style_manager.colors['bg_card'],
-                      fg=self.style_manager.colors['text_primary'],
-                      selectcolor=self.style_manager.colors['bg_input'],
-                      font=self.style_manager.fonts['body']).pack(anchor=tk.W, pady=5)
-        
-        # Health check interval
-        interval_frame = tk.Frame(health_content, bg=self.style_manager.colors['bg_card'])
-        interval_frame.pack(fill=tk.X, pady=10)
-        
-        tk.Label(interval_frame,
-                text="Check Interval (seconds):",
-                bg=self.style_manager.colors['bg_card'],
-                fg=self.style_manager.colors['text_primary'],
-                font=self.style_manager.fonts['body']).pack(side=tk.LEFT)
-        
-        self.health_interval_var = tk.IntVar(value=self.settings.get('health_check', 'interval'))
-        interval_spin = tk.Spinbox(interval_frame,
-                                  from_=30, to=3600, increment=30,
-                                  textvariable=self.health_interval_var,
-                                  width=10,
-                                  bg=self.style_manager.colors['bg_input'],
-                                  fg=self.style_manager.colors['text_primary'])
-        interval_spin.pack(side=tk.LEFT, padx=(10, 0))
-        
-        # Auto recovery
-        self.auto_recover_var = tk.BooleanVar(value=self.settings.get('health_check', 'auto_recover'))
-        tk.Checkbutton(health_content,
-                      text="Enable Automatic Recovery",
-                      variable=self.auto_recover_var,
-                      bg=self.style_manager.colors['bg_card'],
-                      fg=self.style_manager.colors['text_primary'],
-                      selectcolor=self.style_manager.colors['bg_input'],
-                      font=self.style_manager.fonts['body']).pack(anchor=tk.W, pady=5)
-    
-    def create_session_management_tab(self, notebook):
+        self._add_checkbuttons(health_content, 'health_check', (
+            ('health_enabled_var', 'enabled', "Enable Health Monitoring"),
+        ))
+        
+        self._add_spin_rows(health_content, 'health_check', (
+            ('health_interval_var', 'interval', "Check Interval (seconds):", tk.IntVar, 30, 3600, 30, 10),
+        ))
+        
+        self._add_checkbuttons(health_content, 'health_check', (
+            ('auto_recover_var', 'auto_recover', "Enable Automatic Recovery"),
+        ))
+    
+    def create_session_management_tab(self, frame):
         """Create session management settings tab"""
-        frame = ttk.Frame(notebook, style='Premium.TFrame')
-        notebook.add(frame, text="🔄 Session Rotation")
+        colors = self.style_manager.colors
         
-        main_content = tk.Frame(frame, bg=self.style_manager.colors['bg_dark'])
+        main_content = tk.Frame(frame, bg=colors['bg_dark'])
         main_content.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
         
         # Session Management Settings
@@ -850,59 +1048,31 @@ class SettingsWindow:
         )
         session_card.pack(fill=tk.X, pady=10)
         
-        # Auto rotation
-        self.session_rotation_var = tk.BooleanVar(value=self.settings.get('session_management', 'auto_rotate'))
-        tk.Checkbutton(session_content,
-                      text="Enable Automatic Session Rotation",
-                      variable=self.session_rotation_var,
-                      bg=self.style_manager.colors['bg_card'],
-                      fg=self.style_manager.colors['text_primary'],
-                      selectcolor=self.style_manager.colors['bg_input'],
-                      font=self.style_manager.fonts['body']).pack(anchor=tk.W, pady=5)
+        self._add_checkbuttons(session_content, 'session_management', (
+            ('mgmt_session_rotation_var', 'auto_rotate', "Enable Automatic Session Rotation"),
+        ))
         
         # Rotation strategy
-        strategy_frame = tk.Frame(session_content, bg=self.style_manager.colors['bg_card'])
-        strategy_frame.pack(fill=tk.X, pady=10)
-        
-        tk.Label(strategy_frame,
-                text="Rotation Strategy:",
-                bg=self.style_manager.colors['bg_card'],
-                fg=self.style_manager.colors['text_primary'],
-                font=self.style_manager.fonts['body']).pack(side=tk.LEFT)
+        row = session_content.grid_size()[1]
+        tk.Label(session_content, text="Rotation Strategy:").grid(row=row, column=0, sticky='w', pady=10)
         
         self.rotation_strategy_var = tk.StringVar(value=self.settings.get('session_management', 'rotation_strategy'))
-        strategy_combo = ttk.Combobox(strategy_frame,
+        strategy_combo = ttk.Combobox(session_content,
                                      textvariable=self.rotation_strategy_var,
-                                     values=['round_robin', 'random', 'least_used'],
+                                     values=_ROTATION_STRATEGIES,
                                      state='readonly',
                                      width=15)
-        strategy_combo.pack(side=tk.LEFT, padx=(10, 0))
+        strategy_combo.grid(row=row, column=1, sticky='w', padx=(10, 0), pady=10)
         
-        # Max concurrent sessions
-        concurrent_frame = tk.Frame(session_content, bg=self.style_manager.colors['bg_card'])
-        concurrent_frame.pack(fill=tk.X, pady=10)
-        
-        tk.Label(concurrent_frame,
-                text="Max Concurrent Sessions:",
-                bg=self.style_manager.colors['bg_card'],
-                fg=self.style_manager.colors['text_primary'],
-                font=self.style_manager.fonts['body']).pack(side=tk.LEFT)
-        
-        self.max_sessions_var = tk.IntVar(value=self.settings.get('session_management', 'max_concurrent_sessions'))
-        sessions_spin = tk.Spinbox(concurrent_frame,
-                                  from_=1, to=20, increment=1,
-                                  textvariable=self.max_sessions_var,
-                                  width=5,
-                                  bg=self.style_manager.colors['bg_input'],
-                                  fg=self.style_manager.colors['text_primary'])
-        sessions_spin.pack(side=tk.LEFT, padx=(10, 0))
-    
-    def create_debugging_tab(self, notebook):
+        self._add_spin_rows(session_content, 'session_management', (
+            ('max_sessions_var', 'max_concurrent_sessions', "Max Concurrent Sessions:", tk.IntVar, 1, 20, 1, 5),
+        ))
+    
+    def create_debugging_tab(self, frame):
         """Create debugging settings tab"""
-        frame = ttk.Frame(notebook, style='Premium.TFrame')
-        notebook.add(frame, text="🐛 Debugging")
+        colors = self.style_manager.colors
         
-        main_content = tk.Frame(frame, bg=self.style_manager.colors['bg_dark'])
+        main_content = tk.Frame(frame, bg=colors['bg_dark'])
         main_content.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
         
         # Debugging Settings
@@ -911,50 +1081,31 @@ class SettingsWindow:
         )
         debug_card.pack(fill=tk.X, pady=10)
         
-        # Enable debugging
-        self.debug_enabled_var = tk.BooleanVar(value=self.settings.get('debugging', 'enabled'))
-        tk.Checkbutton(debug_content,
-                      text="Enable Debug Mode",
-                      variable=self.debug_enabled_var,
-                      bg=self.style_manager.colors['bg_card'],
-                      fg=self.style_manager.colors['text_primary'],
-                      selectcolor=self.style_manager.colors['bg_input'],
-                      font=self.style_manager.fonts['body']).pack(anchor=tk.W, pady=5)
+        self._add_checkbuttons(debug_content, 'debugging', (
+            ('debug_enabled_var', 'enabled', "Enable Debug Mode"),
+        ))
         
         # Log level
-        log_level_frame = tk.Frame(debug_content, bg=self.style_manager.colors['bg_card'])
-        log_level_frame.pack(fill=tk.X, pady=10)
-        
-        tk.Label(log_level_frame,
-                text="Log Level:",
-                bg=self.style_manager.colors['bg_card'],
-                fg=self.style_manager.colors['text_primary'],
-                font=self.style_manager.fonts['body']).pack(side=tk.LEFT)
+        row = debug_content.grid_size()[1]
+        tk.Label(debug_content, text="Log Level:").grid(row=row, column=0, sticky='w', pady=10)
         
         self.log_level_var = tk.StringVar(value=self.settings.get('debugging', 'log_level'))
-        log_level_combo = ttk.Combobox(log_level_frame,
+        log_level_combo = ttk.Combobox(debug_content,
                                       textvariable=self.log_level_var,
-                                      values=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                                      values=_LOG_LEVELS,
                                       state='readonly',
                                       width=10)
-        log_level_combo.pack(side=tk.LEFT, padx=(10, 0))
-        
-        # Verbose errors
-        self.verbose_errors_var = tk.BooleanVar(value=self.settings.get('debugging', 'verbose_errors'))
-        tk.Checkbutton(debug_content,
-                      text="Verbose Error Messages",
-                      variable=self.verbose_errors_var,
-                      bg=self.style_manager.colors['bg_card'],
-                      fg=self.style_manager.colors['text_primary'],
-                      selectcolor=self.style_manager.colors['bg_input'],
-                      font=self.style_manager.fonts['body']).pack(anchor=tk.W, pady=5)
-    
-    def create_performance_tab(self, notebook):
+        log_level_combo.grid(row=row, column=1, sticky='w', padx=(10, 0), pady=10)
+        
+        self._add_checkbuttons(debug_content, 'debugging', (
+            ('verbose_errors_var', 'verbose_errors', "Verbose Error Messages"),
+        ))
+    
+    def create_performance_tab(self, frame):
         """Create performance settings tab"""
-        frame = ttk.Frame(notebook, style='Premium.TFrame')
-        notebook.add(frame, text="⚡ Performance")
+        colors = self.style_manager.colors
         
-        main_content = tk.Frame(frame, bg=self.style_manager.colors['bg_dark'])
+        main_content = tk.Frame(frame, bg=colors['bg_dark'])
         main_content.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
         
         # Performance Settings
@@ -963,43 +1114,44 @@ class SettingsWindow:
         )
         perf_card.pack(fill=tk.X, pady=10)
         
-        # Max threads
-        threads_frame = tk.Frame(perf_content, bg=self.style_manager.colors['bg_card'])
-        threads_frame.pack(fill=tk.X, pady=10)
-        
-        tk.Label(threads_frame,
-                text="Max Threads:",
-                bg=self.style_manager.colors['bg_card'],
-                fg=self.style_manager.colors['text_primary'],
-                font=self.style_manager.fonts['body']).pack(side=tk.LEFT)
-        
-        self.max_threads_var = tk.IntVar(value=self.settings.get('performance', 'max_threads'))
-        threads_spin = tk.Spinbox(threads_frame,
-                                 from_=1, to=50, increment=1,
-                                 textvariable=self.max_threads_var,
-                                 width=5,
-                                 bg=self.style_manager.colors['bg_input'],
-                                 fg=self.style_manager.colors['text_primary'])
-        threads_spin.pack(side=tk.LEFT, padx=(10, 0))
-        
-        # Batch size
-        batch_frame = tk.Frame(perf_content, bg=self.style_manager.colors['bg_card'])
-        batch_frame.pack(fill=tk.X, pady=10)
-        
-        tk.Label(batch_frame,
-                text="Batch Size:",
-                bg=self.style_manager.colors['bg_card'],
-                fg=self.style_manager.colors['text_primary'],
-                font=self.style_manager.fonts['body']).pack(side=tk.LEFT)
-        
-        self.batch_size_var = tk.IntVar(value=self.settings.get('performance', 'batch_size'))
-        batch_spin = tk.Spinbox(batch_frame,
-                               from_=10, to=500, increment=10,
-                               textvariable=self.batch_size_var,
-                               width=5,
-                               bg=self.style_manager.colors['bg_input'],
-                               fg=self.style_manager.colors['text_primary'])
-        batch_spin.pack(side=tk.LEFT, padx=(10, 0))
+        self._add_spin_rows(perf_content, 'performance', (
+            ('max_threads_var', 'max_threads', "Max Threads:", tk.IntVar, 1, 50, 1, 5),
+            ('batch_size_var', 'batch_size', "Batch Size:", tk.IntVar, 10, 500, 10, 5),
+        ))
+    
+    def _setting_var(self, attr: str, category: str, key: str, var_type):
+        """Create a Tk variable holding a setting's pending value and store it as attr"""
+        var = var_type(value=self.settings.get(category, key))
+        setattr(self, attr, var)
+        return var
+    
+    def _add_spin_rows(self, parent, category: str, rows):
+        """Grid a label + Spinbox per (attribute, key, label, var type, from, to, step, width) row"""
+        row = parent.grid_size()[1]
+        for attr, key, text, var_type, from_, to, increment, width in rows:
+            tk.Label(parent, text=text).grid(row=row, column=0, sticky='w', pady=10)
+            var = self._setting_var(attr, category, key, var_type)
+            ttk.Spinbox(parent, from_=from_, to=to, increment=increment, textvariable=var,
+                        width=width, style='Card.TSpinbox').grid(row=row, column=1, sticky='w',
+                                                                 padx=(10, 0), pady=10)
+            row += 1
+    
+    def _add_checkbuttons(self, parent, category: str, rows):
+        """Grid a BooleanVar-bound Checkbutton per (attribute, key, label) row"""
+        row = parent.grid_size()[1]
+        for attr, key, text in rows:
+            var = self._setting_var(attr, category, key, tk.BooleanVar)
+            ttk.Checkbutton(parent, text=text, variable=var,
+                            style='Card.TCheckbutton').grid(row=row, column=0, columnspan=2,
+                                                            sticky='w', pady=5)
+            row += 1
+    
+    def _add_virtual_checkbuttons(self, rows, category: str, specs):
+        """Add a lazily built Checkbutton row to a VirtualScrollFrame per (attribute, key, label)"""
+        for attr, key, text in specs:
+            var = self._setting_var(attr, category, key, tk.BooleanVar)
+            rows.add(lambda parent, text=text, var=var: ttk.Checkbutton(
+                parent, text=text, variable=var, style='Card.TCheckbutton'), 32)
     
     def test_selected_chain(self):
         """Test the selected proxy chain"""
@@ -1008,6 +1160,11 @@ class SettingsWindow:
             messagebox.showwarning("Warning", "Please select a proxy chain to test.")
             return
         
+        cached = self.proxy_manager.get_cached_test_result(chain_name)
+        if cached is not None:
+            self.show_test_result(None, chain_name, cached)
+            return
+        
         # Show testing dialog
         test_window = tk.Toplevel(self.window)
         test_window.title("Testing Proxy Chain")
@@ -1021,15 +1178,15 @@ class SettingsWindow:
                 font=self.style_manager.fonts['body']).pack(expand=True)
         
         # Test in background thread
-        def test_chain():
-            result = self.proxy_manager.test_proxy_chain(chain_name)
-            test_window.after(0, lambda: self.show_test_result(test_window, chain_name, result))
-        
-        threading.Thread(target=test_chain, daemon=True).start()
+        self.proxy_manager.test_proxy_chain_async(
+            chain_name,
+            lambda result: test_window.after(0, lambda: self.show_test_result(test_window, chain_name, result))
+        )
     
     def show_test_result(self, test_window, chain_name, result):
         """Show proxy chain test result"""
-        test_window.destroy()
+        if test_window is not None:
+            test_window.destroy()
         
         if result:
             messagebox.showinfo("Test Result", f"✅ {chain_name} is working correctly!")
@@ -1037,52 +1194,30 @@ class SettingsWindow:
             messagebox.showerror("Test Result", f"❌ {chain_name} failed connectivity test.")
     
     def save_all_settings(self):
-        """Save all settings from the UI"""
-        # Proxy settings
-        self.settings.set('proxy', 'active_chain', self.chain_var.get())
-        
-        # Anti-detection settings
-        self.settings.set('anti_detection', 'enabled', self.anti_detection_var.get())
-        self.settings.set('anti_detection', 'user_agent_rotation', self.ua_rotation_var.get())
-        self.settings.set('anti_detection', 'random_delays', self.random_delays_var.get())
-        self.settings.set('anti_detection', 'delay_min', self.delay_min_var.get())
-        self.settings.set('anti_detection', 'delay_max', self.delay_max_var.get())
-        self.settings.set('anti_detection', 'session_rotation', self.session_rotation_var.get())
-        self.settings.set('anti_detection', 'stealth_mode', self.stealth_mode_var.get())
-        self.settings.set('anti_detection', 'simulate_human_behavior', self.human_behavior_var.get())
-        
-        # Health check settings
-        self.settings.set('health_check', 'enabled', self.health_enabled_var.get())
-        self.settings.set('health_check', 'interval', self.health_interval_var.get())
-        self.settings.set('health_check', 'auto_recover', self.auto_recover_var.get())
-        
-        # Session management settings
-        self.settings.set('session_management', 'auto_rotate', self.session_rotation_var.get())
-        self.settings.set('session_management', 'rotation_strategy', self.rotation_strategy_var.get())
-        self.settings.set('session_management', 'max_concurrent_sessions', self.max_sessions_var.get())
-        
-        # Debugging settings
-        self.settings.set('debugging', 'enabled', self.debug_enabled_var.get())
-        self.settings.set('debugging', 'log_level', self.log_level_var.get())
-        self.settings.set('debugging', 'verbose_errors', self.verbose_errors_var.get())
-        
-        # Performance settings
-        self.settings.set('performance', 'max_threads', self.max_threads_var.get())
-        self.settings.set('performance', 'batch_size', self.batch_size_var.get())
+        """Save the pending edits of all built tabs with a single write"""
+        payload = {}
+        try:
+            for category, key, attr in self._SETTING_VARS:
+                var = getattr(self, attr, None)
+                if var is not None:
+                    payload.setdefault(category, {})[key] = var.get()
+        except tk.TclError:
+            messagebox.showerror("Settings", "❌ Please enter a valid number in every numeric field.")
+            return
+        self.settings.update(payload)
         
         messagebox.showinfo("Settings", "✅ All settings saved successfully!")
-        self.window.destroy()
+        self.window.withdraw()
     
     def reset_all_settings(self):
         """Reset all settings to defaults"""
         if messagebox.askyesno("Reset Settings", "Are you sure you want to reset all settings to defaults?"):
-            # Reset each category
-            for category in ['proxy', 'anti_detection', 'health_check', 'session_management', 
-                           'debugging', 'performance']:
-                self.settings.reset_category(category)
+            # Security and UI preferences are not managed by this window
+            self.settings.reset_all_to_defaults(('proxy', 'anti_detection', 'health_check',
+                                                 'session_management', 'debugging', 'performance'))
             
             messagebox.showinfo("Settings", "✅ All settings reset to defaults!")
-            self.window.destroy()
+            self.hide()
 
 # Demo and testing functions
 def demo_authentication():
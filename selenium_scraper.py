@@ -12,10 +12,14 @@ robust launch + login preparation so the user can authenticate interactively.
 
 from __future__ import annotations
 
+import atexit
 import logging
-from typing import List, Dict, Optional
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterator, List, Dict, Optional, Tuple
 import os
-import time
+from urllib.parse import urlparse
 
 try:
     from selenium import webdriver
@@ -40,11 +44,104 @@ LOGGER = logging.getLogger(__name__)
 LOGGER.setLevel(logging.INFO)
 
 TELEGRAM_WEB_URL = "https://web.telegram.org/k/"
+# Chat list / left sidebar only render once the user is logged in
+LOGGED_IN_SELECTOR = '#column-left .chatlist, [class*="sidebar-left"]'
+LOGIN_WAIT_SECONDS = 300
+# QR login box, app header or a modal dialog; one combined query per poll
+TELEGRAM_READY_SELECTOR = '[data-testid="auth-qr"], [class*="tg_head"], div[role="dialog"]'
+
+
+@dataclass(slots=True)
+class Member:
+    """One scraped member; the row view over the column-wise scrape results."""
+    username: str = ''
+    user_id: str = ''
+    first_name: str = ''
+    last_name: str = ''
+    phone: str = ''
+    status: str = 'online'
+
+
+# Scraped members are returned column-wise: one parallel list per Member field
+MEMBER_FIELDS: Tuple[str, ...] = Member.__slots__
+
+
+# Idle drivers keyed by (profile_dir, headless, proxy_url); reusing one skips
+# the browser cold start on the next scrape with the same configuration
+_DRIVER_POOL: Dict[Tuple[Optional[str], bool, Optional[str]], object] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _driver_alive(driver) -> bool:
+    """Return True if the browser behind driver still responds."""
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
 
 
 def setup_selenium_driver(profile_dir: Optional[str] = None,
                           headless: bool = False,
                           proxy_url: Optional[str] = None):
+    """Lease a WebDriver for this configuration, reusing an idle pooled one if alive.
+
+    Hand it back with release_selenium_driver() when done.
+    """
+    key = (profile_dir, headless, proxy_url)
+    with _POOL_LOCK:
+        driver = _DRIVER_POOL.pop(key, None)
+    if driver is not None:
+        if _driver_alive(driver):
+            return driver
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    return _create_selenium_driver(profile_dir, headless, proxy_url)
+
+
+def release_selenium_driver(driver,
+                            profile_dir: Optional[str] = None,
+                            headless: bool = False,
+                            proxy_url: Optional[str] = None) -> None:
+    """Return a leased driver to the pool (quits it if one is already pooled)."""
+    key = (profile_dir, headless, proxy_url)
+    with _POOL_LOCK:
+        if key not in _DRIVER_POOL:
+            _DRIVER_POOL[key] = driver
+            return
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+def shutdown_drivers() -> None:
+    """Quit every pooled driver."""
+    with _POOL_LOCK:
+        drivers = list(_DRIVER_POOL.values())
+        _DRIVER_POOL.clear()
+    for driver in drivers:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+atexit.register(shutdown_drivers)
+
+
+@lru_cache(maxsize=64)
+def _parse_proxy(proxy_url: str) -> Tuple[str, Optional[str], int]:
+    """Split a proxy URL like socks5://host:port or http://host:port into (scheme, host, port)."""
+    pu = urlparse(proxy_url)
+    return pu.scheme, pu.hostname, int(pu.port or (80 if pu.scheme in ("http", "https") else 1080))
+
+
+def _create_selenium_driver(profile_dir: Optional[str] = None,
+                            headless: bool = False,
+                            proxy_url: Optional[str] = None):
     """Create a Selenium WebDriver for Chrome or Firefox.
 
     Prefers Chrome/Chromium if available (chromedriver), otherwise falls back to Firefox (geckodriver).
@@ -63,8 +160,18 @@ def setup_selenium_driver(profile_dir: Optional[str] = None,
         chrome_options.add_experimental_option('useAutomationExtension', False)
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-features=Translate,MediaRouter")
+        content_prefs = {"profile.default_content_setting_values.notifications": 2}
         if headless:
             chrome_options.add_argument("--headless=new")
+            # Nobody looks at a headless page: skip avatars/stickers and GPU/extension setup
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_argument("--disable-gpu")
+            chrome_options.add_argument("--disable-extensions")
+            content_prefs["profile.managed_default_content_settings.images"] = 2
+        chrome_options.add_experimental_option("prefs", content_prefs)
+        # Return once the DOM is ready; callers wait for the elements they need
+        chrome_options.page_load_strategy = "eager"
         if profile_dir:
             chrome_options.add_argument(f"--user-data-dir={os.path.abspath(profile_dir)}")
         if proxy_url:
@@ -79,24 +186,25 @@ def setup_selenium_driver(profile_dir: Optional[str] = None,
         # Fallback to Firefox
         try:
             ff_options = FirefoxOptions()
+            ff_options.set_preference("permissions.default.desktop-notification", 2)
+            ff_options.page_load_strategy = "eager"
             if headless:
                 ff_options.add_argument("-headless")
+                ff_options.set_preference("permissions.default.image", 2)
             # Firefox profile
             if profile_dir and os.path.isdir(profile_dir):
                 ff_options.set_preference("profile", os.path.abspath(profile_dir))
             # Proxy
             if proxy_url:
-                # Expect proxy_url like socks5://host:port or http://host:port
-                from urllib.parse import urlparse
-                pu = urlparse(proxy_url)
-                if pu.scheme in ("http", "https"):
+                scheme, host, port = _parse_proxy(proxy_url)
+                if scheme in ("http", "https"):
                     ff_options.set_preference("network.proxy.type", 1)
-                    ff_options.set_preference("network.proxy.http", pu.hostname)
-                    ff_options.set_preference("network.proxy.http_port", int(pu.port or 80))
-                elif pu.scheme.startswith("socks"):
+                    ff_options.set_preference("network.proxy.http", host)
+                    ff_options.set_preference("network.proxy.http_port", port)
+                elif scheme.startswith("socks"):
                     ff_options.set_preference("network.proxy.type", 1)
-                    ff_options.set_preference("network.proxy.socks", pu.hostname)
-                    ff_options.set_preference("network.proxy.socks_port", int(pu.port or 1080))
+                    ff_options.set_preference("network.proxy.socks", host)
+                    ff_options.set_preference("network.proxy.socks_port", port)
             driver = webdriver.Firefox(options=ff_options)
         except Exception as ff_e:
             raise RuntimeError(f"Failed to create WebDriver. Chrome error: {chrome_error}; Firefox error: {ff_e}")
@@ -106,17 +214,30 @@ def setup_selenium_driver(profile_dir: Optional[str] = None,
     return driver
 
 
+def _telegram_ready(driver) -> bool:
+    """Single poll predicate: on the web app URL, or any ready-state element present."""
+    return ("web.telegram.org/k" in driver.current_url
+            or bool(driver.find_elements(By.CSS_SELECTOR, TELEGRAM_READY_SELECTOR)))
+
+
 def wait_for_telegram_loaded(driver, timeout: int = 60) -> bool:
     """Wait until Telegram Web app shell is loaded or login screen is visible."""
     try:
-        WebDriverWait(driver, timeout).until(
-            EC.any_of(
-                EC.url_contains("web.telegram.org/k"),
-                EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="auth-qr"]')),  # QR login box
-                EC.presence_of_element_located((By.CSS_SELECTOR, '[class*="tg_head"]')),
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'div[role="dialog"]')),
-            )
-        )
+        WebDriverWait(driver, timeout).until(_telegram_ready)
+        return True
+    except TimeoutException:
+        return False
+
+
+def _logged_in(driver) -> bool:
+    """WebDriverWait predicate: True once the logged-in app shell is present."""
+    return bool(driver.find_elements(By.CSS_SELECTOR, LOGGED_IN_SELECTOR))
+
+
+def wait_for_login(driver, timeout: int = LOGIN_WAIT_SECONDS) -> bool:
+    """Block until the user finishes logging in, or until timeout expires."""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.5).until(_logged_in)
         return True
     except TimeoutException:
         return False
@@ -138,11 +259,13 @@ def scrape_group_members_via_web(group_url: str,
                                 max_members: int = 1000,
                                 profile_dir: Optional[str] = None,
                                 headless: bool = False,
-                                proxy_url: Optional[str] = None) -> List[Dict]:
+                                proxy_url: Optional[str] = None) -> Dict[str, List]:
     """Bootstrap Selenium to Telegram Web and navigate to group/channel if provided.
 
-    Returns an empty list for now; primary goal is to reliably launch and prepare for login/scrape.
+    Returns members column-wise ({field: [values...]}, see MEMBER_FIELDS); the
+    columns are empty for now, the primary goal is to reliably launch and prepare for login/scrape.
     """
+    members = new_member_columns()
     LOGGER.info("Launching Selenium for Telegram Web…")
     driver = setup_selenium_driver(profile_dir=profile_dir, headless=headless, proxy_url=proxy_url)
 
@@ -165,38 +288,44 @@ def scrape_group_members_via_web(group_url: str,
         # Keep browser open for interactive login unless headless
         if not headless:
             LOGGER.info("Browser launched. Please complete Telegram login if required.")
-            # Poll for up to 5 minutes while user logs in; caller may decide to close earlier
-            end = time.time() + 300
-            while time.time() < end:
-                time.sleep(1)
+            # Wait up to 5 minutes for the user to log in; returns as soon as they do
+            if wait_for_login(driver):
+                LOGGER.info("Telegram login detected")
+            else:
+                LOGGER.warning(f"Telegram login not detected within {LOGIN_WAIT_SECONDS}s")
         else:
-            # In headless mode we just wait briefly
-            time.sleep(3)
+            # In headless mode just wait until the page is usable
+            wait_for_telegram_loaded(driver, timeout=10)
 
-        # TODO: Implement actual member extraction post-login
-        return []
+        # TODO: Implement actual member extraction post-login (extract_member_info per element)
+        return members
     except WebDriverException as e:
         LOGGER.error(f"Selenium error: {e}")
-        return []
+        return members
     finally:
-        try:
-            # Do not close if visible; caller may want to keep it open. Close only in headless mode
-            if headless:
-                driver.quit()
-        except Exception:
-            pass
+        # The pool owns the browser; a visible window stays open for the user
+        release_selenium_driver(driver, profile_dir=profile_dir, headless=headless, proxy_url=proxy_url)
 
 
-def extract_member_info(member_element) -> Dict:
-    """Placeholder for future member extraction."""
-    return {
-        'username': '',
-        'user_id': '',
-        'first_name': '',
-        'last_name': '',
-        'phone': '',
-        'status': 'online'
-    }
+def new_member_columns() -> Dict[str, List]:
+    """Empty column-wise member table, one list per MEMBER_FIELDS entry."""
+    return {field: [] for field in MEMBER_FIELDS}
+
+
+def iter_members(columns: Dict[str, List]) -> Iterator[Member]:
+    """Yield the rows of a column-wise member table as Member records."""
+    for row in zip(*(columns[field] for field in MEMBER_FIELDS)):
+        yield Member(*row)
+
+
+def extract_member_info(member_element, out: Dict[str, List]) -> None:
+    """Placeholder for future member extraction; appends one row to the columns in out."""
+    out['username'].append('')
+    out['user_id'].append('')
+    out['first_name'].append('')
+    out['last_name'].append('')
+    out['phone'].append('')
+    out['status'].append('online')
 
 
 def get_group_info_via_web(group_url: str) -> Dict:
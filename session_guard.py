@@ -18,56 +18,295 @@ To force a real logout in code (advanced):
 Backups are placed in ./session_backups/<session_name>/<timestamp>.session
 """
 from __future__ import annotations
+import errno
 import os
-import shutil
+import select
+import sys
 import threading
-import time
-from datetime import datetime
-from glob import glob
-from typing import List, Optional
+from functools import lru_cache
+from fnmatch import fnmatch
+from itertools import repeat
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+# Backup-only dependencies are imported where they are used, so importing
+# this module just for logout protection stays cheap
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+
+def _copy_fd_range(src_fd: int, dst_fd: int, size: int) -> None:
+    """Copy size bytes in-kernel: copy_file_range (reflink on CoW filesystems), then sendfile.
+
+    Raises OSError when neither call copies all size bytes, so callers can fall back.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        copied = 0
+        try:
+            while copied < size:
+                n = copy_file_range(src_fd, dst_fd, size - copied)
+                if n == 0:
+                    # Some filesystems (FUSE, network mounts) report 0 instead of an error
+                    break
+                copied += n
+        except OSError:
+            # EXDEV/ENOSYS/EINVAL: handled like a short copy below
+            pass
+        if copied == size:
+            return
+        # Rewind whatever was written and try sendfile
+        os.lseek(src_fd, 0, os.SEEK_SET)
+        os.lseek(dst_fd, 0, os.SEEK_SET)
+        os.ftruncate(dst_fd, 0)
+    offset = 0
+    while offset < size:
+        n = os.sendfile(dst_fd, src_fd, offset, size - offset)
+        if n == 0:
+            break
+        offset += n
+    if offset != size:
+        raise OSError(errno.EIO, f"in-kernel copy stopped at {offset} of {size} bytes")
+
+
+@lru_cache(maxsize=None)
+def _win_copyfile2():
+    """kernel32.CopyFile2, or None when it is unavailable (pre-Windows 8)."""
+    try:
+        import ctypes
+        from ctypes import wintypes
+        copyfile2 = ctypes.WinDLL("kernel32", use_last_error=True).CopyFile2
+    except (ImportError, OSError, AttributeError):
+        return None
+    copyfile2.argtypes = (wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_void_p)
+    copyfile2.restype = ctypes.c_long  # HRESULT
+    return copyfile2
+
+
+def _private_opener(path: str, flags: int) -> int:
+    # Session files hold auth keys: new copies are owner-only
+    return os.open(path, flags, 0o600)
+
+
+def _copy_times(st: os.stat_result, dst: str) -> None:
+    """Carry atime/mtime over to dst; unlike copystat this skips the mode/xattr/flags syscalls."""
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _copyfile(src: str, dst: str) -> None:
+    import shutil
+    shutil.copyfile(src, dst)
+    _copy_times(os.stat(src), dst)
+
+
+def _mmap_copy(src: str, dst: str, fsync: bool = False) -> None:
+    """Copy src to dst (with timestamps) as one write from an mmap of src; optionally fsync dst."""
+    import mmap
+    with open(src, "rb") as s, open(dst, "wb", opener=_private_opener) as d:
+        st = os.fstat(s.fileno())
+        if st.st_size:
+            with mmap.mmap(s.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                d.write(view)
+        if fsync:
+            d.flush()
+            os.fsync(d.fileno())
+    _copy_times(st, dst)
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """Copy src to dst with data and timestamps, avoiding userspace buffers where the OS allows."""
+    if sys.platform == "win32":
+        # CopyFile2 copies in the OS (server-side on SMB) and keeps timestamps/attributes
+        copyfile2 = _win_copyfile2()
+        if copyfile2 is None or copyfile2(os.path.abspath(src), os.path.abspath(dst), None) != 0:
+            _mmap_copy(src, dst)
+        return
+    if not sys.platform.startswith("linux"):
+        # File-to-file sendfile is Linux-only (macOS fails with ENOTSOCK)
+        _copyfile(src, dst)
+        return
+    try:
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            st = os.fstat(src_fd)
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                _copy_fd_range(src_fd, dst_fd, st.st_size)
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+    except OSError:
+        _copyfile(src, dst)
+        return
+    _copy_times(st, dst)
+
+
+def _backup_timestamp() -> str:
+    from datetime import datetime
+    return datetime.now().strftime("%Y%m%d_%H%M%S")
+
+
+def _file_digest(path: str) -> str:
+    """BLAKE2b fingerprint of a file, read in chunks into one reused buffer.
+
+    Not mmap: the live session may be truncated mid-hash, which would SIGBUS
+    a mapping but only shortens a read().
+    """
+    import hashlib
+    h = hashlib.blake2b(digest_size=16)
+    buf = bytearray(1 << 16)
+    view = memoryview(buf)
+    with open(path, "rb", buffering=0) as fp:
+        while True:
+            n = fp.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+    return h.hexdigest()
+
 
 class SessionGuard:
-    def __init__(self, sessions_glob: str = "*.session", backup_root: str = "session_backups"):
+    def __init__(self, sessions_glob: str = "*.session", backup_root: str = "session_backups",
+                 keep_backups: Optional[int] = 20):
         self.sessions_glob = sessions_glob
         self.backup_root = backup_root
+        # Newest backups kept per session; None keeps everything
+        self.keep_backups = keep_backups
         self._backup_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        # Wakes the backup thread early (trigger_backup / stop): an eventfd on Linux,
+        # open only while the thread runs; _wake_lock keeps writes off a closed fd
+        self._wake_fd: Optional[int] = None
+        self._wake_lock = threading.Lock()
+        self._wake_event = threading.Event()
+        # (loop, wake event) while run_forever() drives backups on an asyncio loop
+        self._async_scheduler: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = None
+        self._backup_task: Optional[asyncio.Task] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        # session path -> (mtime_ns, size, digest) of its last backup
+        self._last_backup: Dict[str, Tuple[int, int, str]] = {}
+        # session path -> (session name, backup directory); cached once the directory exists
+        self._backup_meta: Dict[str, Tuple[str, str]] = {}
+        # (mtime_ns of the sessions directory, sorted session files)
+        self._session_list: Optional[Tuple[int, List[str]]] = None
         os.makedirs(self.backup_root, exist_ok=True)
 
     def list_session_files(self) -> List[str]:
-        return sorted(glob(self.sessions_glob))
-
-    def _backup_path(self, session_file: str) -> str:
-        base = os.path.basename(session_file)
-        name = base.rsplit(".session", 1)[0]
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        d = os.path.join(self.backup_root, name)
-        os.makedirs(d, exist_ok=True)
+        """Sorted session files, re-globbed only when their directory's mtime changes"""
+        session_dir = os.path.dirname(self.sessions_glob) or "."
+        if any(c in session_dir for c in "*?["):
+            from glob import glob
+            return sorted(glob(self.sessions_glob))
+        try:
+            mtime = os.stat(session_dir).st_mtime_ns
+        except OSError:
+            return []
+        cached = self._session_list
+        if cached is None or cached[0] != mtime:
+            cached = self._session_list = (mtime, self._scan_session_dir(session_dir))
+        return list(cached[1])
+
+    def _scan_session_dir(self, session_dir: str) -> List[str]:
+        """One scandir pass over session_dir matching the sessions_glob file pattern"""
+        prefix = os.path.dirname(self.sessions_glob)
+        pattern = os.path.basename(self.sessions_glob)
+        # Like glob, wildcards don't match dotfiles unless the pattern asks for them
+        show_hidden = pattern.startswith(".")
+        with os.scandir(session_dir) as it:
+            return sorted(os.path.join(prefix, e.name) for e in it
+                          if (show_hidden or not e.name.startswith("."))
+                          and fnmatch(e.name, pattern) and e.is_file())
+
+    def _backup_path(self, session_file: str, ts: Optional[str] = None) -> str:
+        meta = self._backup_meta.get(session_file)
+        if meta is None:
+            base = os.path.basename(session_file)
+            name = base.rsplit(".session", 1)[0]
+            d = os.path.join(self.backup_root, name)
+            os.makedirs(d, exist_ok=True)
+            meta = self._backup_meta[session_file] = (name, d)
+        name, d = meta
+        if ts is None:
+            ts = _backup_timestamp()
         return os.path.join(d, f"{name}.{ts}.session")
 
-    def backup_session(self, session_file: str) -> Optional[str]:
+    def backup_session(self, session_file: str, ts: Optional[str] = None) -> Optional[str]:
+        """Back up session_file unless it is missing or unchanged since its last backup"""
         try:
-            if not os.path.exists(session_file):
+            st = os.stat(session_file)
+            last = self._last_backup.get(session_file)
+            if last and last[0] == st.st_mtime_ns and last[1] == st.st_size:
+                return None
+            digest = _file_digest(session_file)
+            if last and last[2] == digest:
+                self._last_backup[session_file] = (st.st_mtime_ns, st.st_size, digest)
+                return None
+            target = self._backup_path(session_file, ts)
+            try:
+                _fast_copy(session_file, target)
+            except FileNotFoundError:
+                # The cached backup directory was removed: recreate it and retry once
+                self._backup_meta.pop(session_file, None)
+                target = self._backup_path(session_file, ts)
+                _fast_copy(session_file, target)
+            if os.stat(target).st_size != st.st_size:
+                # Short copy (or the session changed mid-copy): don't let it become
+                # the newest backup, and retry on the next pass
+                os.remove(target)
                 return None
-            target = self._backup_path(session_file)
-            shutil.copy2(session_file, target)
+            self._last_backup[session_file] = (st.st_mtime_ns, st.st_size, digest)
+            if self.keep_backups is not None:
+                self._prune_backups(*self._backup_meta[session_file])
             return target
         except Exception:
             return None
 
+    def _backup_pool(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self._pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="session-backup")
+            return self._pool
+
+    def _prune_backups(self, name: str, d: str):
+        """Delete all but the newest keep_backups backups of a session"""
+        import heapq
+        prefix = f"{name}."
+        with os.scandir(d) as it:
+            names = [e.name for e in it if e.name.startswith(prefix) and e.name.endswith(".session")]
+        excess = len(names) - self.keep_backups
+        if excess <= 0:
+            return
+        # Timestamped names sort chronologically: the smallest are the oldest
+        for old in heapq.nsmallest(excess, names):
+            try:
+                os.unlink(os.path.join(d, old))
+            except FileNotFoundError:
+                pass
+
     def backup_all_sessions(self) -> int:
-        count = 0
-        for f in self.list_session_files():
-            if self.backup_session(f):
-                count += 1
-        return count
+        files = self.list_session_files()
+        # One timestamp for the whole pass
+        ts = _backup_timestamp()
+        if len(files) <= 1:
+            return sum(1 for f in files if self.backup_session(f, ts))
+        return sum(1 for target in self._backup_pool().map(self.backup_session, files, repeat(ts))
+                   if target)
 
     def latest_backup_for(self, session_name: str) -> Optional[str]:
         d = os.path.join(self.backup_root, session_name)
-        if not os.path.isdir(d):
+        prefix = f"{session_name}."
+        try:
+            with os.scandir(d) as it:
+                # Timestamps in the names sort chronologically, so the max name is the newest
+                latest = max((e.name for e in it
+                              if e.name.startswith(prefix) and e.name.endswith(".session")),
+                             default=None)
+        except (FileNotFoundError, NotADirectoryError):
             return None
-        files = sorted(glob(os.path.join(d, f"{session_name}.*.session")))
-        return files[-1] if files else None
+        return os.path.join(d, latest) if latest else None
 
     def restore_session(self, session_name: str) -> bool:
         """Restore latest backup into working directory as <session_name>.session"""
@@ -76,34 +315,123 @@ class SessionGuard:
             if not latest:
                 return False
             target = f"{session_name}.session"
-            shutil.copy2(latest, target)
+            # The restored session must survive a crash right after restore
+            _mmap_copy(latest, target, fsync=True)
             return True
         except Exception:
             return False
 
     def start_backup_scheduler(self, interval_sec: int = 300):
+        """Schedule backups on the running asyncio loop if there is one, else on a daemon thread"""
         if self._backup_thread and self._backup_thread.is_alive():
             return
+        if self._backup_task and not self._backup_task.done():
+            return
         self._stop_event.clear()
+        import asyncio
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None:
+            self._backup_task = loop.create_task(self.run_forever(interval_sec))
+            return
+        if hasattr(os, "eventfd"):
+            with self._wake_lock:
+                self._wake_fd = os.eventfd(0, os.EFD_CLOEXEC | os.EFD_NONBLOCK)
         self._backup_thread = threading.Thread(target=self._backup_loop, args=(interval_sec,), daemon=True)
         self._backup_thread.start()
 
+    async def backup_all_sessions_async(self) -> int:
+        """backup_all_sessions() for coroutines: copies run concurrently on the backup pool"""
+        import asyncio
+        loop = asyncio.get_running_loop()
+        pool = self._backup_pool()
+        ts = _backup_timestamp()
+        targets = await asyncio.gather(*(loop.run_in_executor(pool, self.backup_session, f, ts)
+                                         for f in self.list_session_files()))
+        return sum(1 for target in targets if target)
+
+    async def run_forever(self, interval_sec: int = 300):
+        """Back up all sessions now and then every interval until stop_backup_scheduler()"""
+        import asyncio
+        wake = asyncio.Event()
+        scheduler = self._async_scheduler = (asyncio.get_running_loop(), wake)
+        try:
+            # Exit once stopped, or replaced by a restarted scheduler
+            while not self._stop_event.is_set() and self._async_scheduler is scheduler:
+                try:
+                    await self.backup_all_sessions_async()
+                except Exception:
+                    pass
+                try:
+                    await asyncio.wait_for(wake.wait(), interval_sec)
+                except asyncio.TimeoutError:
+                    pass
+                wake.clear()
+        finally:
+            # A restarted scheduler may already have installed its own
+            if self._async_scheduler is scheduler:
+                self._async_scheduler = None
+
+    def trigger_backup(self):
+        """Run a backup pass now instead of waiting for the next interval"""
+        self._wake()
+
+    def _wake(self):
+        async_scheduler = self._async_scheduler
+        if async_scheduler is not None:
+            loop, wake = async_scheduler
+            loop.call_soon_threadsafe(wake.set)
+        else:
+            with self._wake_lock:
+                if self._wake_fd is not None:
+                    os.eventfd_write(self._wake_fd, 1)
+                else:
+                    self._wake_event.set()
+
+    def _wait_for_wake(self, timeout: float):
+        if self._wake_fd is not None:
+            if select.select([self._wake_fd], [], [], timeout)[0]:
+                try:
+                    os.eventfd_read(self._wake_fd)
+                except BlockingIOError:
+                    pass
+        elif self._wake_event.wait(timeout):
+            self._wake_event.clear()
+
     def stop_backup_scheduler(self):
         self._stop_event.set()
+        self._wake()
+        task, self._backup_task = self._backup_task, None
+        if task is not None and not task.done():
+            # Cancel outright so an immediate restart doesn't see a still-running task
+            task.get_loop().call_soon_threadsafe(task.cancel)
         if self._backup_thread and self._backup_thread.is_alive():
             self._backup_thread.join(timeout=2)
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
 
     def _backup_loop(self, interval_sec: int):
-        while not self._stop_event.is_set():
-            try:
-                self.backup_all_sessions()
-            except Exception:
-                pass
-            # Sleep in small chunks to be interruptible
-            for _ in range(int(interval_sec)):
+        # Back up immediately, then once per interval or whenever woken
+        timeout = 0
+        try:
+            while True:
+                self._wait_for_wake(timeout)
                 if self._stop_event.is_set():
                     break
-                time.sleep(1)
+                try:
+                    self.backup_all_sessions()
+                except Exception:
+                    pass
+                timeout = interval_sec
+        finally:
+            with self._wake_lock:
+                fd, self._wake_fd = self._wake_fd, None
+            if fd is not None:
+                os.close(fd)
 
     def enable_logout_protection(self) -> bool:
         """Monkey-patch Telethon's TelegramClient.log_out to block by default.
@@ -122,6 +450,7 @@ class SessionGuard:
             TelegramClient._orig_log_out = TelegramClient.log_out  # type: ignore[attr-defined]
 
         def guarded_log_out(self, *args, **kwargs):  # type: ignore[no-redef]
+            # Checked live on every call so unsetting the variable re-arms the guard
             allow = os.environ.get("ALLOW_TELEGRAM_LOGOUT") == "1"
             if not allow:
                 raise RuntimeError("Logout blocked by SessionGuard. Set ALLOW_TELEGRAM_LOGOUT=1 and call _orig_log_out() to bypass.")
@@ -3,103 +3,50 @@
 import tkinter as tk
 from tkinter import messagebox
 import hashlib
+import hmac
+import os
 import time
 
+from login_form import build_login_form, get_root
+
 class SimpleAuth:
     def __init__(self):
         self.username = "admin"
-        self.password = "password123!"
+        # Only a keyed digest of the password is kept in memory
+        self._digest_key = os.urandom(16)
+        self._password_digest = self._digest("password123!")
         self.authenticated = False
         self.login_attempts = 0
         self.max_attempts = 3
         
+    def _digest(self, password):
+        return hashlib.blake2b(password.encode('utf-8'), digest_size=32, key=self._digest_key).digest()
+    
     def authenticate(self, username, password):
         """Simple authentication check"""
-        if self.login_attempts >= self.max_attempts:
+        attempts = self.login_attempts
+        if attempts >= self.max_attempts:
             return False
             
-        if username == self.username and password == self.password:
+        compare = hmac.compare_digest
+        password_ok = compare(self._digest(password), self._password_digest)
+        if compare(username.encode('utf-8'), self.username.encode('utf-8')) and password_ok:
             self.authenticated = True
             self.login_attempts = 0
             return True
         else:
-            self.login_attempts += 1
+            self.login_attempts = attempts + 1
             return False
     
     def show_login_window(self):
         """Show login window and return success/failure"""
-        root = tk.Tk()
-        root.title("🔐 Premium Login")
-        root.geometry("400x300")
-        root.configure(bg='#1a1a1a')
-        root.resizable(False, False)
-        
-        # Center window
-        root.update_idletasks()
-        x = (root.winfo_screenwidth() // 2) - (400 // 2)
-        y = (root.winfo_screenheight() // 2) - (300 // 2)
-        root.geometry(f"400x300+{x}+{y}")
-        
-        # Make window stay on top initially
-        root.lift()
-        root.attributes('-topmost', True)
-        root.after(100, lambda: root.attributes('-topmost', False))
-        
-        # Main frame
-        main_frame = tk.Frame(root, bg='#1a1a1a')
-        main_frame.pack(expand=True, fill=tk.BOTH, padx=40, pady=40)
-        
-        # Title
-        title_label = tk.Label(main_frame,
-                              text="🔐 PREMIUM LOGIN",
-                              bg='#1a1a1a',
-                              fg='#ffffff',
-                              font=('Arial', 18, 'bold'))
-        title_label.pack(pady=(0, 30))
+        window = tk.Toplevel(get_root())
+        # Build everything while unmapped, then show the finished window once
+        window.withdraw()
+        window.title("🔐 Premium Login")
+        window.configure(bg='#1a1a1a')
+        window.resizable(False, False)
         
-        # Username field
-        tk.Label(main_frame,
-                text="Username:",
-                bg='#1a1a1a',
-                fg='#cccccc',
-                font=('Arial', 10)).pack(anchor=tk.W, pady=(0, 5))
-        
-        username_entry = tk.Entry(main_frame,
-                                 font=('Arial', 12),
-                                 bg='#333333',
-                                 fg='#ffffff',
-                                 insertbackground='#ffffff',
-                                 relief='flat',
-                                 bd=0)
-        username_entry.pack(fill=tk.X, pady=(0, 15), ipady=8)
-        username_entry.insert(0, "admin")
-        
-        # Password field
-        tk.Label(main_frame,
-                text="Password:",
-                bg='#1a1a1a',
-                fg='#cccccc',
-                font=('Arial', 10)).pack(anchor=tk.W, pady=(0, 5))
-        
-        password_entry = tk.Entry(main_frame,
-                                 font=('Arial', 12),
-                                 bg='#333333',
-                                 fg='#ffffff',
-                                 insertbackground='#ffffff',
-                                 relief='flat',
-                                 bd=0,
-                                 show='*')
-        password_entry.pack(fill=tk.X, pady=(0, 20), ipady=8)
-        
-        # Status label
-        status_label = tk.Label(main_frame,
-                               text="Enter credentials: admin / password123!",
-                               bg='#1a1a1a',
-                               fg='#888888',
-                               font=('Arial', 9))
-        status_label.pack(pady=(0, 20))
-        
-        # Login button
         def do_login():
             username = username_entry.get().strip()
             password = password_entry.get().strip()
@@ -110,7 +57,7 @@ class SimpleAuth:
             
             if self.authenticate(username, password):
                 status_label.config(text="✅ Login successful!", fg='#66ff66')
-                root.after(1000, root.destroy)
+                window.after(1000, window.destroy)
             else:
                 remaining = self.max_attempts - self.login_attempts
                 if remaining > 0:
@@ -118,37 +65,36 @@ class SimpleAuth:
                     password_entry.delete(0, tk.END)
                 else:
                     status_label.config(text="❌ Too many failed attempts!", fg='#ff6666')
-                    root.after(2000, root.destroy)
+                    window.after(2000, window.destroy)
+        
+        username_entry, password_entry, status_label = build_login_form(
+            window, "🔐 PREMIUM LOGIN", "Enter credentials: admin / password123!", do_login)
         
-        login_btn = tk.Button(main_frame,
-                             text="🔐 LOGIN",
-                             command=do_login,
-                             bg='#8B7355',  # Elegant beige
-                             fg='#ffffff',
-                             font=('Arial', 12, 'bold'),
-                             relief='flat',
-                             bd=0,
-                             cursor='hand2')
-        login_btn.pack(fill=tk.X, pady=10, ipady=10)
+        # Center window; the size is fixed, so no layout pass is needed first
+        x = (window.winfo_screenwidth() // 2) - (400 // 2)
+        y = (window.winfo_screenheight() // 2) - (300 // 2)
+        window.geometry(f"400x300+{x}+{y}")
         
-        # Bind Enter key
-        def on_enter(event):
-            do_login()
+        # Stay on top until the window has actually been mapped
+        def on_map(event):
+            if event.widget is window:
+                window.attributes('-topmost', False)
+                window.unbind('<Map>')
         
-        root.bind('<Return>', on_enter)
-        password_entry.bind('<Return>', on_enter)
-        username_entry.bind('<Return>', on_enter)
+        window.attributes('-topmost', True)
+        window.bind('<Map>', on_map)
+        window.deiconify()
         
         # Focus on password field after a short delay
         def focus_password():
             password_entry.focus_set()
             password_entry.icursor(tk.END)
         
-        root.after(200, focus_password)
+        window.after(200, focus_password)
         
-        # Run the window
+        # Run the shared event loop until this window is closed
         try:
-            root.mainloop()
+            window.wait_window()
         except:
             pass
             